@@ -1,42 +1,38 @@
-import speech_recognition as sr
 import os
 import subprocess
 
+import numpy as np
+from faster_whisper import WhisperModel
+
+SAMPLE_RATE = 16000
+
 def test_transcribe(video_path):
-    wav_path = video_path + ".wav"
-    
-    print(f"[1/3] Converting video to WAV: {video_path}")
+    print(f"[1/3] Decoding audio from: {video_path}")
+    # Raw 16 kHz mono PCM straight from ffmpeg's stdout - no temp WAV on disk
     result = subprocess.run(
-        ["ffmpeg", "-y", "-i", video_path, "-ac", "1", "-ar", "16000", wav_path],
-        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        ["ffmpeg", "-y", "-i", video_path, "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
     )
     if result.returncode != 0:
         print("❌ FFmpeg failed. Make sure ffmpeg is installed and the file path is correct.")
         return
+    audio = np.frombuffer(result.stdout, dtype=np.int16).astype(np.float32) / 32768.0
     
-    print("[2/3] Extracting audio and sending to Google Speech-to-Text...")
-    recognizer = sr.Recognizer()
-    with sr.AudioFile(wav_path) as source:
-        audio = recognizer.record(source, duration=60)
-
-    try:
-        text = recognizer.recognize_google(audio)
-        print(f"\n✅ Transcript:\n{text}\n")
-
-        # Save to .txt
-        txt_path = video_path + "_transcript.txt"
-        with open(txt_path, "w", encoding="utf-8") as f:
-            f.write(text)
-        print(f"[3/3] Transcript saved to: {txt_path}")
-
-    except sr.UnknownValueError:
+    print("[2/3] Transcribing locally with faster-whisper...")
+    # int8 CPU inference; same model knob as the bot (WHISPER_MODEL)
+    model = WhisperModel(os.getenv("WHISPER_MODEL", "base"), device="cpu", compute_type="int8", cpu_threads=os.cpu_count() or 0)
+    segments, info = model.transcribe(audio, beam_size=1, vad_filter=True)
+    text = " ".join(segment.text.strip() for segment in segments).strip()
+    if not text:
         print("⚠️ Could not detect speech in the video (maybe no dialogue?).")
-    except sr.RequestError as e:
-        print(f"❌ Google Speech API error: {e}")
-    finally:
-        if os.path.exists(wav_path):
-            os.remove(wav_path)
-            print("Cleaned up temporary WAV file.")
+        return
+    print(f"\n✅ Transcript ({info.language}):\n{text}\n")
+
+    # Save to .txt
+    txt_path = video_path + "_transcript.txt"
+    with open(txt_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    print(f"[3/3] Transcript saved to: {txt_path}")
 
 
 # ---- EDIT THIS PATH to point to a real downloaded video ----
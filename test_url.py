@@ -4,7 +4,8 @@ import json
 import sys
 import os
 
-url = "https://www.youtube.com/shorts/qM79_itR0Nc"
+# Pass URLs on the command line to test several at once
+urls = sys.argv[1:] or ["https://www.youtube.com/shorts/qM79_itR0Nc"]
 
 ydl_opts = {
     'outtmpl': 'downloads/%(title).100s.%(ext)s', 
@@ -33,11 +34,14 @@ ydl_opts = {
 if not os.path.exists('downloads'):
     os.makedirs('downloads')
 
-print(f"Analyzing URL: {url}")
-try:
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(url, download=True)
-        print("SUCCESS: Downloaded media")
-        print(f"Title: {info.get('title')}")
-except Exception as e:
-    print(f"ERROR: {e}")
+# One YoutubeDL for every URL: extractor setup and the cookie jar are reused
+# (the bot keeps one warm instance per worker process the same way)
+with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+    for url in urls:
+        print(f"Analyzing URL: {url}")
+        try:
+            info = ydl.extract_info(url, download=True)
+            print("SUCCESS: Downloaded media")
+            print(f"Title: {info.get('title')}")
+        except Exception as e:
+            print(f"ERROR: {e}")
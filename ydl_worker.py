@@ -0,0 +1,113 @@
+# yt-dlp worker side of bot.py's YDL_POOL. Kept apart from bot.py so spawned
+# worker processes only import this module (and yt_dlp on their first job),
+# not the whole bot with its Telegram, Whisper and RSS state.
+import os
+import logging
+from typing import Dict, Tuple, Any
+
+logger = logging.getLogger(__name__)
+
+def init_worker_logging(log_format: str):
+    """Pool initializer: spawned workers start without the bot's logging setup."""
+    logging.basicConfig(level=logging.INFO, format=log_format)
+
+# One warm YoutubeDL per mode (video / audio-only) in each worker process, so
+# extractor setup and cookie parsing happen once per process, not per request.
+# A worker runs one job at a time, so the instances are never shared.
+_YDL_INSTANCES: Dict[bool, Any] = {}
+
+YDL_HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Sec-Fetch-Mode': 'navigate',
+}
+BASE_YDL_OPTS = {
+    'outtmpl': '%(title).100s.%(ext)s',
+    'quiet': True,
+    'no_warnings': True,
+    'nocheckcertificate': True,
+    'geo_bypass': True,
+    'retries': 5,
+    'fragment_retries': 10,
+    # DASH/HLS media (YouTube, Instagram) arrives in fragments; fetch
+    # several at once so the download stage finishes sooner
+    'concurrent_fragment_downloads': 4,
+    'extractor_retries': 5,
+    'file_access_retries': 5,
+    'socket_timeout': 60,
+    'force_ipv4': True,
+    'extractor_args': {
+        'youtube': {
+            'player_client': ['android', 'ios', 'mweb', 'tv'],
+        }
+    },
+    'http_headers': YDL_HTTP_HEADERS,
+}
+VIDEO_YDL_OPTS = {
+    'format': 'bestvideo[vcodec^=avc1]+bestaudio[acodec^=mp4a]/best[vcodec^=avc1][acodec^=mp4a]/best[ext=mp4]/best',
+}
+AUDIO_YDL_OPTS = {
+    'format': 'bestaudio/best',
+    'postprocessors': [{'key': 'FFmpegExtractAudio','preferredcodec': 'mp3','preferredquality': '192'}],
+}
+COOKIES_PATH = 'cookies.txt'
+
+def build_ydl_opts(is_audio_only: bool) -> Dict[str, Any]:
+    ydl_opts = {**BASE_YDL_OPTS, **(AUDIO_YDL_OPTS if is_audio_only else VIDEO_YDL_OPTS)}
+    # Checked here, not at import: main() writes cookies.txt after the module loads
+    if os.path.exists(COOKIES_PATH):
+        ydl_opts['cookiefile'] = COOKIES_PATH
+        logger.info("Using cookies for download.")
+    return ydl_opts
+
+def get_ydl(is_audio_only: bool):
+    # Options are built here, on first use in each worker, rather than per
+    # request in the parent and pickled across with every job
+    ydl = _YDL_INSTANCES.get(is_audio_only)
+    if ydl is None:
+        # yt-dlp pulls in hundreds of extractor modules; only the workers need
+        # them, on their first job, so the bot itself starts without the import
+        import yt_dlp
+        ydl = _YDL_INSTANCES[is_audio_only] = yt_dlp.YoutubeDL(build_ydl_opts(is_audio_only))
+    return ydl
+
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024  # Telegram bot upload limit
+TOO_LARGE_PREFIX = "❌ File is too large"
+
+def estimated_filesize(info: Dict[str, Any]) -> int:
+    """Size yt-dlp expects for the selected format(s); 0 when the site doesn't report it."""
+    formats = info.get('requested_formats') or [info]
+    return sum(f.get('filesize') or f.get('filesize_approx') or 0 for f in formats)
+
+def run_ydl(url: str, is_audio_only: bool, output_dir: str) -> Tuple[str, Dict, None]:
+    """Runs in a YDL_POOL worker process. Must stay top-level so it can be pickled."""
+    try:
+        ydl = get_ydl(is_audio_only)
+        # The instance is reused across requests; only the target dir changes
+        ydl.params['paths'] = {'home': output_dir}
+        info = ydl.extract_info(url, download=False)
+        if url.startswith("ytsearch"):
+            if 'entries' in info and len(info['entries']) > 0:
+                first_entry = info['entries'][0]
+                real_url = first_entry['webpage_url']
+                info = ydl.extract_info(real_url, download=False)
+            else:
+                raise Exception("No search results found.")
+
+        # Reject oversized videos from the metadata, before transferring anything
+        file_size = estimated_filesize(info)
+        if not is_audio_only and file_size > MAX_UPLOAD_BYTES:
+            raise Exception(f"{TOO_LARGE_PREFIX} (~{file_size / (1024 * 1024):.2f}MB). Telegram bot limit is 50MB.")
+
+        # Download from the metadata already extracted instead of fetching it again
+        info = ydl.process_ie_result(info, download=True)
+
+        # The final path after merging/post-processing (e.g. the extracted .mp3)
+        downloads = info.get('requested_downloads') or [{}]
+        filename = downloads[0].get('filepath') or ydl.prepare_filename(info)
+        return filename, ydl.sanitize_info(info), None
+    except Exception as e:
+        # yt-dlp errors carry traceback objects that can't be pickled back to
+        # the parent; re-raise with just the message the caller matches on.
+        raise Exception(str(e)) from None